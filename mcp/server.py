@@ -19,48 +19,126 @@ Register in Claude Desktop (~/Library/Application Support/Claude/claude_desktop_
     }
 """
 
-import subprocess
+import asyncio
+import contextlib
+import functools
+import inspect
+import mmap
 import sys
 import os
+import shutil
+import time
 from pathlib import Path
 from mcp.server.fastmcp import FastMCP
 
 # Resolve the repo root relative to this file (mcp/ is one level below root)
 REPO_ROOT = Path(__file__).parent.parent.resolve()
 BINARY = REPO_ROOT / "zig-out" / "bin" / "bareclaw"
+# String forms for subprocess argv/cwd, so tools don't re-stringify per call.
+BINARY_STR = os.fspath(BINARY)
+REPO_ROOT_STR = os.fspath(REPO_ROOT)
+
+# BareClaw runtime state under the user's home directory.
+BARECLAW_HOME = Path.home() / ".bareclaw"
+CONFIG_PATH = BARECLAW_HOME / "config.toml"
+WORKSPACE_DIR = BARECLAW_HOME / "workspace"
+AUDIT_LOG = WORKSPACE_DIR / "audit.log"
+MEMORY_DIR = WORKSPACE_DIR / "memory"
+
+
+# Absolute paths of external tools (zig, bash), resolved on first use so
+# spawns skip the PATH walk. Misses aren't cached, so a tool installed while
+# the server is running is still picked up.
+_WHICH: dict[str, str] = {}
+
+
+def _which(name: str) -> str | None:
+    path = _WHICH.get(name)
+    if path is None:
+        path = shutil.which(name)
+        if path is not None:
+            _WHICH[name] = path
+    return path
+
+
+def _error_result(message: str) -> dict:
+    return {
+        "stdout": "",
+        "stderr": message,
+        "returncode": -1,
+        "ok": False,
+    }
+
+
+def _timeout_result(timeout: int) -> dict:
+    return _error_result(f"Command timed out after {timeout}s")
+
+
+async def _kill(proc: asyncio.subprocess.Process) -> None:
+    """Kill a child process (if still running) and reap it."""
+    if proc.returncode is None:
+        with contextlib.suppress(ProcessLookupError):
+            proc.kill()
+        await proc.wait()
+
+
+async def _spawn(cmd: list[str], cwd: Path | None, env: dict | None) -> asyncio.subprocess.Process:
+    """Start cmd with stdout/stderr piped back to the server."""
+    # Python opens fds non-inheritable (PEP 446), so skipping close_fds'
+    # per-spawn fd sweep leaks nothing into the child. stdin is the MCP
+    # stdio channel; children must never read from it.
+    return await asyncio.create_subprocess_exec(
+        *cmd,
+        cwd=os.fspath(cwd) if cwd else REPO_ROOT_STR,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env=env,
+        close_fds=False,
+    )
 
 
-def _run(cmd: list[str], cwd: Path | None = None, timeout: int = 60, env: dict | None = None) -> dict:
+async def _run(cmd: list[str], cwd: Path | None = None, timeout: int = 60, env: dict | None = None) -> dict:
     """Run a subprocess and return stdout, stderr, and return code."""
+    # Fail fast on a missing executable instead of paying for a fork.
+    name = None
+    if cmd[0] == BINARY_STR:
+        if not BINARY.exists():
+            return _error_result(f"Binary NOT found at: {BINARY}\nRun build() first.")
+    elif not os.path.isabs(cmd[0]):
+        name = cmd[0]
+        exe = _which(name)
+        if exe is None:
+            return _error_result(f"{name} not found in PATH")
+        cmd = [exe, *cmd[1:]]
     try:
-        result = subprocess.run(
-            cmd,
-            cwd=str(cwd or REPO_ROOT),
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            env=env,
-        )
-        return {
-            "stdout": result.stdout.strip(),
-            "stderr": result.stderr.strip(),
-            "returncode": result.returncode,
-            "ok": result.returncode == 0,
-        }
-    except subprocess.TimeoutExpired:
-        return {
-            "stdout": "",
-            "stderr": f"Command timed out after {timeout}s",
-            "returncode": -1,
-            "ok": False,
-        }
+        proc = await _spawn(cmd, cwd, env)
     except FileNotFoundError as e:
-        return {
-            "stdout": "",
-            "stderr": str(e),
-            "returncode": -1,
-            "ok": False,
-        }
+        if name is None:
+            return _error_result(str(e))
+        # The cached path went stale (e.g. toolchain upgrade); resolve again once.
+        _WHICH.pop(name, None)
+        exe = _which(name)
+        if exe is None:
+            return _error_result(f"{name} not found in PATH")
+        cmd = [exe, *cmd[1:]]
+        try:
+            proc = await _spawn(cmd, cwd, env)
+        except FileNotFoundError as e:
+            return _error_result(str(e))
+    # Always reap the child: on timeout, cancellation, or any other error.
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        return _timeout_result(timeout)
+    finally:
+        await _kill(proc)
+    return {
+        "stdout": stdout.decode("utf-8", "replace").strip(),
+        "stderr": stderr.decode("utf-8", "replace").strip(),
+        "returncode": proc.returncode,
+        "ok": proc.returncode == 0,
+    }
 
 
 def _format(result: dict) -> str:
@@ -75,6 +153,53 @@ def _format(result: dict) -> str:
     return "\n".join(parts) if parts else "(no output)"
 
 
+def _mtime_cached(stamp, ttl: float = 2.0):
+    """Memoize a zero-argument tool while stamp() is unchanged, for at most ttl seconds.
+
+    stamp() returns directory mtimes (or anything comparable) describing the
+    inputs. It is taken right after the wrapped call so stamps that depend on
+    what the call found line up with its result; a change racing the call is
+    picked up once the entry expires. If stamp() raises OSError (e.g. the
+    directory is missing) nothing is cached.
+    """
+    def decorator(fn):
+        cached = None  # (stamp, monotonic timestamp, result)
+
+        @functools.wraps(fn)
+        def wrapper():
+            nonlocal cached
+            if cached is not None and time.monotonic() - cached[1] < ttl:
+                try:
+                    if stamp() == cached[0]:
+                        return cached[2]
+                except OSError:
+                    pass
+            result = fn()
+            try:
+                cached = (stamp(), time.monotonic(), result)
+            except OSError:
+                cached = None
+            return result
+
+        return wrapper
+    return decorator
+
+
+def _dir_mtime(path: Path) -> int:
+    return os.stat(path).st_mtime_ns
+
+
+def _dirs_stamp(dirs: list[str]) -> tuple[int, ...]:
+    """Stamp covering every directory the last scan listed.
+
+    Any entry added to or removed from one of them bumps its mtime (a new
+    subdirectory bumps its parent's).
+    """
+    if not dirs:
+        raise FileNotFoundError
+    return tuple(os.stat(d).st_mtime_ns for d in dirs)
+
+
 mcp = FastMCP("bareclaw")
 
 
@@ -84,7 +209,7 @@ mcp = FastMCP("bareclaw")
 
 
 @mcp.tool()
-def build(release: bool = False) -> str:
+async def build(release: bool = False) -> str:
     """Build the BareClaw Zig binary.
 
     Args:
@@ -93,16 +218,16 @@ def build(release: bool = False) -> str:
     cmd = ["zig", "build"]
     if release:
         cmd += ["-Doptimize=ReleaseSafe"]
-    result = _run(cmd)
+    result = await _run(cmd)
     if result["ok"]:
         return f"Build succeeded. Binary at: {BINARY}\n{_format(result)}"
     return f"Build FAILED.\n{_format(result)}"
 
 
 @mcp.tool()
-def run_tests() -> str:
+async def run_tests() -> str:
     """Run all BareClaw Zig unit tests via `zig build test`."""
-    result = _run(["zig", "build", "test"])
+    result = await _run(["zig", "build", "test"])
     if result["ok"]:
         return f"All tests passed.\n{_format(result)}"
     return f"Tests FAILED.\n{_format(result)}"
@@ -111,10 +236,11 @@ def run_tests() -> str:
 @mcp.tool()
 def binary_exists() -> str:
     """Check whether the bareclaw binary has been built and exists on disk."""
-    if BINARY.exists():
+    try:
         size = BINARY.stat().st_size
-        return f"Binary exists: {BINARY} ({size:,} bytes)"
-    return f"Binary NOT found at: {BINARY}\nRun build() first."
+    except FileNotFoundError:
+        return f"Binary NOT found at: {BINARY}\nRun build() first."
+    return f"Binary exists: {BINARY} ({size:,} bytes)"
 
 
 # ---------------------------------------------------------------------------
@@ -122,18 +248,21 @@ def binary_exists() -> str:
 # ---------------------------------------------------------------------------
 
 
+async def _status(timeout: int = 60) -> dict:
+    return await _run([BINARY_STR, "status"], timeout=timeout)
+
+
 @mcp.tool()
-def status() -> str:
+async def status() -> str:
     """Run `bareclaw status` to inspect the current runtime configuration.
 
     Shows workspace path, config path, provider, model, and memory backend.
     """
-    result = _run([str(BINARY), "status"])
-    return _format(result)
+    return _format(await _status())
 
 
 @mcp.tool()
-def run_agent(prompt: str) -> str:
+async def run_agent(prompt: str) -> str:
     """Send a prompt to the BareClaw agent and return its response.
 
     Runs `bareclaw agent "<prompt>"` as a single-turn interaction.
@@ -141,29 +270,35 @@ def run_agent(prompt: str) -> str:
     Args:
         prompt: The input to send to the agent.
     """
-    result = _run([str(BINARY), "agent", prompt], timeout=30)
+    result = await _run([BINARY_STR, "agent", prompt], timeout=30)
     return _format(result)
 
 
 @mcp.tool()
-def run_cron() -> str:
+async def run_cron() -> str:
     """Run `bareclaw cron` to execute any scheduled tasks once."""
-    result = _run([str(BINARY), "cron"])
+    result = await _run([BINARY_STR, "cron"])
     return _format(result)
 
 
+async def _list_peripherals(timeout: int = 60) -> dict:
+    return await _run([BINARY_STR, "peripheral"], timeout=timeout)
+
+
 @mcp.tool()
-def list_peripherals() -> str:
+async def list_peripherals() -> str:
     """Run `bareclaw peripheral` to list configured hardware peripherals."""
-    result = _run([str(BINARY), "peripheral"])
-    return _format(result)
+    return _format(await _list_peripherals())
+
+
+async def _help(timeout: int = 60) -> dict:
+    return await _run([BINARY_STR], timeout=timeout)
 
 
 @mcp.tool()
-def help() -> str:
+async def help() -> str:
     """Run `bareclaw` with no arguments to show the CLI usage/help text."""
-    result = _run([str(BINARY)])
-    return _format(result)
+    return _format(await _help())
 
 
 # ---------------------------------------------------------------------------
@@ -172,16 +307,55 @@ def help() -> str:
 
 
 @mcp.tool()
+@_mtime_cached(lambda: _dir_mtime(REPO_ROOT / "src"))
 def list_source_files() -> str:
     """List all Zig source files in the src/ directory with their sizes."""
     src_dir = REPO_ROOT / "src"
-    if not src_dir.exists():
+    # DirEntry caches is_file()/stat() from the directory scan itself.
+    try:
+        with os.scandir(src_dir) as it:
+            entries = sorted((e for e in it if e.name.endswith(".zig") and e.is_file()), key=lambda e: e.name)
+    except FileNotFoundError:
         return "src/ directory not found."
-    lines = []
-    for f in sorted(src_dir.glob("*.zig")):
-        size = f.stat().st_size
-        lines.append(f"{f.name:30s} {size:>6,} bytes")
-    return "\n".join(lines) if lines else "No .zig files found in src/"
+    fmt = "{:<30} {:>6,} bytes".format
+    return "\n".join(fmt(e.name, e.stat().st_size) for e in entries) or "No .zig files found in src/"
+
+
+# Files larger than this are returned as head + tail with the middle elided.
+_SOURCE_MAX_BYTES = 256 * 1024
+_SOURCE_HEAD_BYTES = 128 * 1024
+_SOURCE_TAIL_BYTES = 64 * 1024
+# Files larger than this are decoded straight out of an mmap.
+_SOURCE_MMAP_BYTES = 64 * 1024
+
+
+@functools.lru_cache(maxsize=32)
+def _read_source(path: str, mtime_ns: int, size: int) -> str:
+    """Read and decode a source file. mtime_ns and size only key the cache."""
+    with open(path, "rb") as f:
+        if size > _SOURCE_MMAP_BYTES:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # Truncated to empty since the stat (or not mappable): read instead.
+                mm = None
+            if mm is not None:
+                # Decode from the page cache via a memoryview: no intermediate bytes
+                # copy, and for truncated files only the head/tail pages are touched.
+                with mm, memoryview(mm) as view:
+                    n = len(view)
+                    if 0 < n <= _SOURCE_MAX_BYTES:
+                        return str(view, "utf-8", "replace")
+                    if n:
+                        omitted = n - _SOURCE_HEAD_BYTES - _SOURCE_TAIL_BYTES
+                        return (
+                            str(view[:_SOURCE_HEAD_BYTES], "utf-8", "replace")
+                            + f"\n...<truncated {omitted:,} bytes>...\n"
+                            + str(view[-_SOURCE_TAIL_BYTES:], "utf-8", "replace")
+                        )
+        # Pre-sized read skips read_text()'s growable buffer.
+        data = f.read(size)
+    return data.decode("utf-8", "replace")
 
 
 @mcp.tool()
@@ -192,27 +366,42 @@ def read_source_file(filename: str) -> str:
         filename: The filename within src/ (e.g. "agent.zig", "main.zig").
     """
     path = REPO_ROOT / "src" / filename
-    if not path.exists():
+    try:
+        st = path.stat()
+    except FileNotFoundError:
         return f"File not found: src/{filename}"
     if not path.suffix == ".zig":
         return "Only .zig files are supported."
-    return path.read_text()
+    return _read_source(os.fspath(path), st.st_mtime_ns, st.st_size)
+
+
+# Directories listed by the last repo_structure call: the root plus each
+# top-level directory whose children are shown.
+_REPO_DIRS: list[str] = []
 
 
 @mcp.tool()
+@_mtime_cached(lambda: _dirs_stamp(_REPO_DIRS))
 def repo_structure() -> str:
     """Show the top-level directory structure of the BareClaw repository."""
     lines = []
-    for item in sorted(REPO_ROOT.iterdir()):
+    dirs = [REPO_ROOT_STR]
+    with os.scandir(REPO_ROOT) as it:
+        items = sorted(it, key=lambda e: e.name)
+    for item in items:
         if item.name.startswith(".") or item.name in ("zig-out", ".zig-cache"):
             continue
-        if item.is_dir():
+        if item.is_dir(follow_symlinks=False):
             lines.append(f"{item.name}/")
-            for child in sorted(item.iterdir()):
-                if not child.name.startswith("."):
-                    lines.append(f"  {child.name}")
+            dirs.append(item.path)
+            with os.scandir(item.path) as children:
+                names = sorted(c.name for c in children)
+            for name in names:
+                if not name.startswith("."):
+                    lines.append(f"  {name}")
         else:
             lines.append(item.name)
+    _REPO_DIRS[:] = dirs
     return "\n".join(lines)
 
 
@@ -224,14 +413,14 @@ def repo_structure() -> str:
 @mcp.tool()
 def read_config() -> str:
     """Read the current BareClaw config file (~/.bareclaw/config.toml)."""
-    config_path = Path.home() / ".bareclaw" / "config.toml"
-    if not config_path.exists():
+    try:
+        return CONFIG_PATH.read_text()
+    except FileNotFoundError:
         return "Config file not found. Run `bareclaw onboard` or `bareclaw status` to initialize."
-    return config_path.read_text()
 
 
 @mcp.tool()
-def run_smoke_tests() -> str:
+async def run_smoke_tests() -> str:
     """Run the BareClaw smoke test suite. No Discord required.
 
     USE THIS after every non-trivial code change to verify nothing broke.
@@ -240,12 +429,65 @@ def run_smoke_tests() -> str:
     Fast (~15s). Always run before run_integration_test_discord.
     """
     script = REPO_ROOT / "tests" / "smoke.sh"
-    result = _run(["bash", str(script)], timeout=90)
+    result = await _run(["bash", str(script)], timeout=90)
     return _format(result)
 
 
 @mcp.tool()
-def run_integration_test_discord() -> str:
+async def build_and_test(release: bool = False) -> str:
+    """Build, run the unit tests, and run the smoke tests in one call.
+
+    `zig build` and `zig build test` run concurrently; the smoke tests start
+    as soon as the build has installed a fresh binary, overlapping with the
+    unit tests. The smoke script's own unit-test step is skipped
+    (SKIP_UNIT_TESTS=1) so the tests only run once. Smoke tests are skipped
+    if the build fails.
+
+    Args:
+        release: If true, build with ReleaseSafe optimization. Defaults to debug.
+    """
+    cmd = ["zig", "build"]
+    if release:
+        cmd += ["-Doptimize=ReleaseSafe"]
+
+    async def build_then_smoke() -> tuple[dict, dict | None]:
+        built = await _run(cmd)
+        if not built["ok"]:
+            return built, None
+        script = REPO_ROOT / "tests" / "smoke.sh"
+        env = {**os.environ, "SKIP_UNIT_TESTS": "1"}
+        return built, await _run(["bash", str(script)], timeout=90, env=env)
+
+    (built, smoke), tested = await asyncio.gather(build_then_smoke(), _run(["zig", "build", "test"]))
+
+    report = [
+        f"Build {'succeeded' if built['ok'] else 'FAILED'}.\n{_format(built)}",
+        f"{'All tests passed' if tested['ok'] else 'Tests FAILED'}.\n{_format(tested)}",
+    ]
+    if smoke is None:
+        report.append("Smoke tests skipped (build failed).")
+    else:
+        report.append(f"Smoke tests {'passed' if smoke['ok'] else 'FAILED'}.\n{_format(smoke)}")
+    return "\n\n".join(report)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_dot_env(path: str, mtime_ns: int) -> dict[str, str]:
+    """Parse KEY=VALUE lines from a .env file. mtime_ns only keys the cache."""
+    with open(path) as f:
+        text = f.read()
+    parsed = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, val = line.split("=", 1)
+        parsed.setdefault(key.strip(), val.strip().strip('"').strip("'"))  # first one wins
+    return parsed
+
+
+@mcp.tool()
+async def run_integration_test_discord() -> str:
     """Run the full Discord end-to-end integration test.
 
     USE THIS to validate the Discord channel feature end-to-end.
@@ -260,29 +502,26 @@ def run_integration_test_discord() -> str:
       3. discord_token in ~/.bareclaw/config.toml
     """
     script = REPO_ROOT / "tests" / "integration_discord.sh"
-    env = os.environ.copy()
-    env["BINARY"] = str(BINARY)
 
     # Load .env from the repo root and inject DISCORD_TEST_TOKEN so the
     # integration test uses the dev bot token regardless of what personal
     # token is set in config.toml.
     dot_env = REPO_ROOT / ".env"
-    if dot_env.exists():
-        for line in dot_env.read_text().splitlines():
-            line = line.strip()
-            if not line or line.startswith("#") or "=" not in line:
-                continue
-            key, _, val = line.partition("=")
-            key = key.strip()
-            val = val.strip().strip('"').strip("'")
-            env.setdefault(key, val)  # don't override vars already in env
-
-    result = _run(["bash", str(script)], timeout=120, env=env)
+    try:
+        st = dot_env.stat()
+    except FileNotFoundError:
+        parsed = {}
+    else:
+        parsed = _load_dot_env(os.fspath(dot_env), st.st_mtime_ns)
+    # Don't override vars already in env.
+    env = {**parsed, **os.environ, "BINARY": BINARY_STR}
+
+    result = await _run(["bash", str(script)], timeout=120, env=env)
     return _format(result)
 
 
 @mcp.tool()
-def config_set(key: str, value: str) -> str:
+async def config_set(key: str, value: str) -> str:
     """Set a config value and persist it to ~/.bareclaw/config.toml.
 
     Args:
@@ -291,28 +530,43 @@ def config_set(key: str, value: str) -> str:
              discord_token, telegram_token.
         value: The value to set.
     """
-    result = _run([str(BINARY), "config", "set", key, value])
+    result = await _run([BINARY_STR, "config", "set", key, value])
     return _format(result)
 
 
+async def _config_get(timeout: int = 60) -> dict:
+    return await _run([BINARY_STR, "config", "get"], timeout=timeout)
+
+
 @mcp.tool()
-def config_get() -> str:
+async def config_get() -> str:
     """Show all current config values (secrets are masked)."""
-    result = _run([str(BINARY), "config", "get"])
-    return _format(result)
+    return _format(await _config_get())
+
+
+# Directories seen by the last workspace_contents scan.
+_WORKSPACE_DIRS: list[str] = []
 
 
 @mcp.tool()
+@_mtime_cached(lambda: _dirs_stamp(_WORKSPACE_DIRS))
 def workspace_contents() -> str:
     """List files in the BareClaw workspace directory (~/.bareclaw/workspace/)."""
-    workspace = Path.home() / ".bareclaw" / "workspace"
-    if not workspace.exists():
+    if not WORKSPACE_DIR.exists():
+        _WORKSPACE_DIRS.clear()
         return "Workspace directory does not exist yet."
+    # Plain strings throughout: no Path object per entry.
+    root = os.fspath(WORKSPACE_DIR)
+    root_len = len(root) + 1
+    dirs = []
     lines = []
-    for item in sorted(workspace.rglob("*")):
-        rel = item.relative_to(workspace)
-        if item.is_file():
-            lines.append(str(rel))
+    for dirpath, _, filenames in os.walk(root):
+        dirs.append(dirpath)
+        prefix = dirpath[root_len:]
+        base = prefix + os.sep if prefix else ""
+        lines.extend(base + fn for fn in filenames)
+    lines.sort()
+    _WORKSPACE_DIRS[:] = dirs
     return "\n".join(lines) if lines else "Workspace exists but is empty."
 
 
@@ -322,19 +576,44 @@ def workspace_contents() -> str:
 
 
 @mcp.tool()
-def agent_status() -> str:
+async def agent_status() -> str:
     """Return agent runtime status: workspace path, memory entry count, policy.
 
     Calls the built-in agent_status tool via a single-turn agent run.
     Useful for checking the health of the agent's working state.
     """
-    result = _run([str(BINARY), "mcp", "call", "bareclaw", "agent_status"], timeout=15)
+    result = await _run([BINARY_STR, "mcp", "call", "bareclaw", "agent_status"], timeout=15)
     # Fallback: call via bareclaw agent (single-turn) if mcp call not available
     if not result["ok"]:
-        result = _run([str(BINARY), "agent", "call agent_status tool and show the result"], timeout=30)
+        result = await _run([BINARY_STR, "agent", "call agent_status tool and show the result"], timeout=30)
     return _format(result)
 
 
+def _tail_lines(path: Path, n: int) -> list[str]:
+    """Return the last n lines of a file, reading backwards in doubling chunks."""
+    if n <= 0:
+        return []
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        end = os.fstat(fd).st_size
+        chunk = 65536
+        buf = b""
+        # n + 1 newlines guarantee n complete lines even with a trailing newline.
+        while end > 0 and buf.count(b"\n") <= n:
+            pos = max(0, end - chunk)
+            os.lseek(fd, pos, os.SEEK_SET)
+            buf = os.read(fd, end - pos) + buf
+            end = pos
+            chunk *= 2
+    finally:
+        os.close(fd)
+    if buf.endswith(b"\n"):
+        buf = buf[:-1]
+    if not buf:
+        return []
+    return b"\n".join(buf.split(b"\n")[-n:]).decode("utf-8", "replace").split("\n")
+
+
 @mcp.tool()
 def audit_log_read(n: int = 50) -> str:
     """Read the last N lines of the BareClaw audit log.
@@ -345,26 +624,25 @@ def audit_log_read(n: int = 50) -> str:
     Args:
         n: Number of lines to return (default: 50).
     """
-    audit_path = Path.home() / ".bareclaw" / "workspace" / "audit.log"
-    if not audit_path.exists():
+    try:
+        tail = _tail_lines(AUDIT_LOG, n)
+    except FileNotFoundError:
         return "(audit log not yet created)"
-    lines = audit_path.read_text().splitlines()
-    tail = lines[-n:] if len(lines) > n else lines
     return "\n".join(tail) if tail else "(audit log is empty)"
 
 
 @mcp.tool()
+@_mtime_cached(lambda: _dir_mtime(MEMORY_DIR))
 def memory_list_keys() -> str:
     """List all keys stored in BareClaw's memory backend.
 
     Returns the logical key name (filename without .md extension) for each
     memory entry stored in ~/.bareclaw/workspace/memory/.
     """
-    memory_dir = Path.home() / ".bareclaw" / "workspace" / "memory"
-    if not memory_dir.exists():
+    if not MEMORY_DIR.exists():
         return "(no memory directory yet)"
     keys = sorted(
-        f.stem for f in memory_dir.glob("*.md") if f.is_file()
+        f.stem for f in MEMORY_DIR.glob("*.md") if f.is_file()
     )
     if not keys:
         return "(no memory entries)"
@@ -380,25 +658,30 @@ def memory_delete_prefix(prefix: str) -> str:
     Args:
         prefix: Key prefix to match (e.g. "session/" deletes all session entries).
     """
-    memory_dir = Path.home() / ".bareclaw" / "workspace" / "memory"
-    if not memory_dir.exists():
-        return f"deleted 0 entries (no memory directory)"
     deleted = 0
-    for f in list(memory_dir.glob("*.md")):
-        if f.stem.startswith(prefix):
-            f.unlink()
-            deleted += 1
+    try:
+        with os.scandir(MEMORY_DIR) as it:
+            for e in it:
+                name = e.name
+                if name.endswith(".md") and name[:-3].startswith(prefix) and e.is_file():
+                    os.unlink(e.path)
+                    deleted += 1
+    except FileNotFoundError:
+        return f"deleted 0 entries (no memory directory)"
     return f"deleted {deleted} memory entries with prefix '{prefix}'"
 
 
+async def _doctor(timeout: int = 60) -> dict:
+    return await _run([BINARY_STR, "doctor"], timeout=timeout)
+
+
 @mcp.tool()
-def doctor() -> str:
+async def doctor() -> str:
     """Run `bareclaw doctor` to check health of all subsystems.
 
     Checks workspace writability, config file, API key, audit log, and cron tasks.
     """
-    result = _run([str(BINARY), "doctor"])
-    return _format(result)
+    return _format(await _doctor())
 
 
 # ---------------------------------------------------------------------------
@@ -406,15 +689,18 @@ def doctor() -> str:
 # ---------------------------------------------------------------------------
 
 
+async def _cron_list(timeout: int = 60) -> dict:
+    return await _run([BINARY_STR, "cron", "list"], timeout=timeout)
+
+
 @mcp.tool()
-def cron_list() -> str:
+async def cron_list() -> str:
     """List all configured cron tasks with schedule, status, and time until next run."""
-    result = _run([str(BINARY), "cron", "list"])
-    return _format(result)
+    return _format(await _cron_list())
 
 
 @mcp.tool()
-def cron_add(schedule: str, command: str) -> str:
+async def cron_add(schedule: str, command: str) -> str:
     """Add a new cron task.
 
     Args:
@@ -423,45 +709,45 @@ def cron_add(schedule: str, command: str) -> str:
                   "*/15 * * * *" for every 15 minutes).
         command:  Shell command to run when the task fires.
     """
-    result = _run([str(BINARY), "cron", "add", schedule, command])
+    result = await _run([BINARY_STR, "cron", "add", schedule, command])
     return _format(result)
 
 
 @mcp.tool()
-def cron_remove(task_id: str) -> str:
+async def cron_remove(task_id: str) -> str:
     """Remove a cron task by ID (e.g. "t1").
 
     Args:
         task_id: The task ID shown in cron_list().
     """
-    result = _run([str(BINARY), "cron", "remove", task_id])
+    result = await _run([BINARY_STR, "cron", "remove", task_id])
     return _format(result)
 
 
 @mcp.tool()
-def cron_pause(task_id: str) -> str:
+async def cron_pause(task_id: str) -> str:
     """Pause a cron task (keep it but stop it from firing).
 
     Args:
         task_id: The task ID shown in cron_list().
     """
-    result = _run([str(BINARY), "cron", "pause", task_id])
+    result = await _run([BINARY_STR, "cron", "pause", task_id])
     return _format(result)
 
 
 @mcp.tool()
-def cron_resume(task_id: str) -> str:
+async def cron_resume(task_id: str) -> str:
     """Resume a paused cron task.
 
     Args:
         task_id: The task ID shown in cron_list().
     """
-    result = _run([str(BINARY), "cron", "resume", task_id])
+    result = await _run([BINARY_STR, "cron", "resume", task_id])
     return _format(result)
 
 
 @mcp.tool()
-def cron_add_prompt(schedule: str, prompt: str) -> str:
+async def cron_add_prompt(schedule: str, prompt: str) -> str:
     """Add a new agent-prompt cron task.
 
     When the task fires, BareClaw runs the agent with the given prompt instead
@@ -473,19 +759,19 @@ def cron_add_prompt(schedule: str, prompt: str) -> str:
                   or standard 5-field format (e.g. "0 9 * * *" for 9am daily).
         prompt:   The agent prompt to send when the task fires.
     """
-    result = _run([str(BINARY), "cron", "add-prompt", schedule, prompt])
+    result = await _run([BINARY_STR, "cron", "add-prompt", schedule, prompt])
     return _format(result)
 
 
 @mcp.tool()
-def cron_run() -> str:
+async def cron_run() -> str:
     """Execute all cron tasks that are currently due.
 
     Tasks whose next_run timestamp has passed are executed and their next_run
     is advanced to the following scheduled time. Tasks not yet due are skipped.
     Prompt tasks call the agent; shell tasks exec the command.
     """
-    result = _run([str(BINARY), "cron", "run"], timeout=60)
+    result = await _run([BINARY_STR, "cron", "run"], timeout=60)
     return _format(result)
 
 
@@ -494,18 +780,28 @@ def cron_run() -> str:
 # ---------------------------------------------------------------------------
 
 
+async def _mcp_list_servers(timeout: int = 60) -> dict:
+    return await _run([BINARY_STR, "mcp", "list-servers"], timeout=timeout)
+
+
 @mcp.tool()
-def mcp_list_servers() -> str:
+async def mcp_list_servers() -> str:
     """List all configured MCP servers that BareClaw knows about.
 
     MCP servers extend BareClaw with external tools (e.g. AutoTrader, custom bots).
     """
-    result = _run([str(BINARY), "mcp", "list-servers"])
-    return _format(result)
+    return _format(await _mcp_list_servers())
+
+
+async def _mcp_list_tools(server: str = "", timeout: int = 30) -> dict:
+    cmd = [BINARY_STR, "mcp", "list-tools"]
+    if server:
+        cmd.append(server)
+    return await _run(cmd, timeout=timeout)
 
 
 @mcp.tool()
-def mcp_list_tools(server: str = "") -> str:
+async def mcp_list_tools(server: str = "") -> str:
     """List all tools available from configured MCP servers.
 
     Connects to each server, runs tools/list, and displays the results.
@@ -513,15 +809,11 @@ def mcp_list_tools(server: str = "") -> str:
     Args:
         server: Filter to a specific server by name. If empty, lists all servers.
     """
-    cmd = [str(BINARY), "mcp", "list-tools"]
-    if server:
-        cmd.append(server)
-    result = _run(cmd, timeout=30)
-    return _format(result)
+    return _format(await _mcp_list_tools(server))
 
 
 @mcp.tool()
-def mcp_call_tool(server: str, tool: str, args_json: str = "{}") -> str:
+async def mcp_call_tool(server: str, tool: str, args_json: str = "{}") -> str:
     """Call a specific tool on a configured MCP server.
 
     Useful for testing MCP server connectivity and tool responses.
@@ -531,10 +823,80 @@ def mcp_call_tool(server: str, tool: str, args_json: str = "{}") -> str:
         tool: The tool name to call (e.g. "get_balance").
         args_json: JSON object of arguments, e.g. '{"symbol": "AAPL"}'.
     """
-    result = _run([str(BINARY), "mcp", "call", server, tool, args_json], timeout=30)
+    result = await _run([BINARY_STR, "mcp", "call", server, tool, args_json], timeout=30)
     return _format(result)
 
 
+# Parsed ~/.bareclaw/config.toml as ((mtime_ns, size), text, {key: value}).
+_config_cache: tuple[tuple[int, int], str, dict[str, str]] | None = None
+
+
+def _parse_config(text: str) -> dict[str, str]:
+    """Parse config.toml the way the binary does (config.zig parseSimpleToml).
+
+    One `key = "value"` per line; the value is taken verbatim between the
+    outer quotes, with no TOML escape processing.
+    """
+    cfg = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, val = line.split("=", 1)
+        val = val.strip(" \t")
+        if len(val) >= 2 and val[0] == '"' and val[-1] == '"':
+            val = val[1:-1]
+        cfg[key.strip()] = val
+    return cfg
+
+
+def _load_config() -> tuple[str, dict[str, str]]:
+    """Return (text, parsed) for config.toml, re-reading only when it changes.
+
+    Raises FileNotFoundError if the config file does not exist.
+    """
+    global _config_cache
+    # Size guards against a rewrite (e.g. `bareclaw config set`) landing in
+    # the same mtime tick, which _write_config_value would otherwise revert.
+    st = CONFIG_PATH.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    if _config_cache is None or _config_cache[0] != key:
+        text = CONFIG_PATH.read_text()
+        _config_cache = (key, text, _parse_config(text))
+    return _config_cache[1], _config_cache[2]
+
+
+def _write_config_value(key: str, value: str) -> None:
+    """Replace (or append) a single `key = "value"` line in config.toml."""
+    global _config_cache
+    text, _ = _load_config()
+    new_line = f'{key} = "{value}"'
+    lines = text.splitlines()
+    for i, line in enumerate(lines):
+        stripped = line.strip()
+        if stripped and not stripped.startswith("#") and stripped.split("=", 1)[0].strip() == key:
+            lines[i] = new_line
+            break
+    else:
+        lines.append(new_line)
+    CONFIG_PATH.write_text("\n".join(lines) + "\n")
+    _config_cache = None
+
+
+def _parse_mcp_servers(value: str) -> dict[str, str]:
+    """Split a pipe-separated `name=command|...` value into {name: command}."""
+    servers = {}
+    for entry in value.split("|"):
+        if entry:
+            name, _, command = entry.partition("=")
+            servers[name] = command
+    return servers
+
+
+def _join_mcp_servers(servers: dict[str, str]) -> str:
+    return "|".join(f"{name}={command}" for name, command in servers.items())
+
+
 @mcp.tool()
 def mcp_add_server(name: str, command: str) -> str:
     """Add or update an MCP server in BareClaw's config.
@@ -546,28 +908,18 @@ def mcp_add_server(name: str, command: str) -> str:
         name: Short identifier for this server (e.g. "autotrader").
         command: Full command to launch the server (e.g. "trader mcp serve").
     """
-    config_path = Path.home() / ".bareclaw" / "config.toml"
-    if not config_path.exists():
+    if not name or any(c in name for c in "=|\n") or any(c in command for c in "|\n"):
+        return "Invalid server: name must not contain '=', '|' or newlines; command must not contain '|' or newlines."
+    try:
+        _, cfg = _load_config()
+    except FileNotFoundError:
         return "Config file not found. Run bareclaw status first."
 
-    content = config_path.read_text()
-
-    # Parse existing mcp_servers value.
-    import re
-    match = re.search(r'^mcp_servers\s*=\s*"(.*?)"', content, re.MULTILINE)
-    if match:
-        existing = match.group(1)
-        # Remove any existing entry with the same name.
-        entries = [e for e in existing.split("|") if e and not e.startswith(f"{name}=")]
-        entries.append(f"{name}={command}")
-        new_val = "|".join(entries)
-        new_content = content[:match.start()] + f'mcp_servers = "{new_val}"' + content[match.end():]
-    else:
-        # No mcp_servers line yet — append it.
-        new_content = content.rstrip() + f'\nmcp_servers = "{name}={command}"\n'
-
-    config_path.write_text(new_content)
-    return f"✓ Added MCP server '{name}' → {command}\n  Saved to {config_path}"
+    servers = _parse_mcp_servers(cfg.get("mcp_servers", ""))
+    if servers.get(name) != command:
+        servers[name] = command
+        _write_config_value("mcp_servers", _join_mcp_servers(servers))
+    return f"✓ Added MCP server '{name}' → {command}\n  Saved to {CONFIG_PATH}"
 
 
 @mcp.tool()
@@ -577,29 +929,139 @@ def mcp_remove_server(name: str) -> str:
     Args:
         name: The server name to remove (e.g. "autotrader").
     """
-    config_path = Path.home() / ".bareclaw" / "config.toml"
-    if not config_path.exists():
+    try:
+        _, cfg = _load_config()
+    except FileNotFoundError:
         return "Config file not found."
 
-    content = config_path.read_text()
-
-    import re
-    match = re.search(r'^mcp_servers\s*=\s*"(.*?)"', content, re.MULTILINE)
-    if not match:
+    if "mcp_servers" not in cfg:
         return f"No mcp_servers configured. Nothing to remove."
 
-    existing = match.group(1)
-    entries = [e for e in existing.split("|") if e and not e.startswith(f"{name}=")]
-    removed = len(existing.split("|")) - len(entries)
-    if removed == 0:
+    servers = _parse_mcp_servers(cfg["mcp_servers"])
+    if servers.pop(name, None) is None:
         return f"Server '{name}' not found in mcp_servers."
 
-    new_val = "|".join(entries)
-    new_content = content[:match.start()] + f'mcp_servers = "{new_val}"' + content[match.end():]
-    config_path.write_text(new_content)
+    new_val = _join_mcp_servers(servers)
+    _write_config_value("mcp_servers", new_val)
     return f"✓ Removed MCP server '{name}'. Remaining: {new_val or '(none)'}"
 
 
+# ---------------------------------------------------------------------------
+# Batch execution
+# ---------------------------------------------------------------------------
+
+
+# Read-only tools batch_run may dispatch to, paired with the helper that
+# returns the raw _run result for binary-backed tools (None for tools
+# implemented in Python). Anything else is rejected, so a batch can never
+# shell out to an arbitrary command.
+_BATCH_TOOLS = {
+    fn.__name__: (fn, raw)
+    for fn, raw in (
+        (binary_exists, None),
+        (status, _status),
+        (list_peripherals, _list_peripherals),
+        (help, _help),
+        (list_source_files, None),
+        (read_source_file, None),
+        (repo_structure, None),
+        (read_config, None),
+        (config_get, _config_get),
+        (workspace_contents, None),
+        (audit_log_read, None),
+        (memory_list_keys, None),
+        (doctor, _doctor),
+        (cron_list, _cron_list),
+        (mcp_list_servers, _mcp_list_servers),
+        (mcp_list_tools, _mcp_list_tools),
+    )
+}
+
+
+def _coerce_args(fn, args: list) -> list:
+    """Convert JSON args to the types annotated on fn's parameters."""
+    params = list(inspect.signature(fn).parameters.values())
+    if len(args) > len(params):
+        raise TypeError(f"{fn.__name__}() takes at most {len(params)} argument(s), got {len(args)}")
+    return [p.annotation(a) if p.annotation in (int, float, str) else a for p, a in zip(params, args)]
+
+
+def _batch_error(record: dict, message: str) -> dict:
+    return {**record, "stdout": "", "stderr": message, "rc": -1, "ok": False}
+
+
+async def _dispatch(item: dict, sem: asyncio.Semaphore, abort: asyncio.Event) -> dict:
+    """Run one batch_run item and return its {stdout, stderr, rc, ok} record."""
+    if not isinstance(item, dict):
+        return _batch_error({"input": item, "description": ""}, "Each item must be an object with an 'input' key.")
+    raw = item.get("input", "")
+    tokens = [raw] if isinstance(raw, str) else list(raw) if isinstance(raw, list) else []
+    record = {"input": raw, "description": item.get("description", "")}
+    entry = _BATCH_TOOLS.get(tokens[0]) if tokens and isinstance(tokens[0], str) else None
+    if entry is None:
+        allowed = ", ".join(sorted(_BATCH_TOOLS))
+        return _batch_error(record, f"Unknown or disallowed tool: {raw!r}. Allowed: {allowed}")
+    fn, raw_fn = entry
+    try:
+        args = _coerce_args(fn, tokens[1:])
+    except (TypeError, ValueError) as e:
+        return _batch_error(record, f"{type(e).__name__}: {e}")
+    # Without an explicit timeout each tool keeps its own default.
+    kwargs = {}
+    if "timeout" in item:
+        timeout = item["timeout"]
+        if isinstance(timeout, bool) or not isinstance(timeout, (int, float)) or timeout <= 0:
+            return _batch_error(record, f"Invalid timeout: {timeout!r} (must be a positive number of seconds)")
+        kwargs["timeout"] = timeout
+    async with sem:
+        if abort.is_set():
+            return _batch_error(record, "skipped: an earlier item failed")
+        if raw_fn is not None:
+            # Binary-backed: use the raw result to get the real exit code.
+            result = await raw_fn(*args, **kwargs)
+            result = {**record, "stdout": result["stdout"], "stderr": result["stderr"],
+                      "rc": result["returncode"], "ok": result["ok"]}
+        else:
+            try:
+                result = {**record, "stdout": fn(*args), "stderr": "", "rc": 0, "ok": True}
+            except Exception as e:
+                result = _batch_error(record, f"{type(e).__name__}: {e}")
+    if not result["ok"] and not item.get("ignore_errors", True):
+        abort.set()
+    return result
+
+
+@mcp.tool()
+async def batch_run(inputs: list[dict]) -> list[dict]:
+    """Run several read-only inspection tools concurrently in one call.
+
+    Use this during orientation instead of calling status(), config_get(),
+    list_source_files(), repo_structure(), etc. one at a time.
+
+    Args:
+        inputs: List of items, each a dict with:
+            input: Tool name (e.g. "status") or [name, *args]
+                   (e.g. ["read_source_file", "agent.zig"]).
+            description: Optional label echoed back in the result.
+            timeout: Seconds before a binary-backed item is abandoned
+                     (default: the tool's own timeout).
+            ignore_errors: If false, a failure skips items not yet started
+                           (default: true).
+
+    Returns one {input, description, stdout, stderr, rc, ok} dict per item,
+    in the same order as inputs.
+    """
+    sem = asyncio.Semaphore(os.cpu_count() or 4)
+    abort = asyncio.Event()
+    results = await asyncio.gather(*(_dispatch(item, sem, abort) for item in inputs), return_exceptions=True)
+    return [
+        _batch_error({"input": item.get("input") if isinstance(item, dict) else item, "description": ""},
+                     f"{type(r).__name__}: {r}")
+        if isinstance(r, BaseException) else r
+        for item, r in zip(inputs, results)
+    ]
+
+
 def main():
     mcp.run(transport="stdio")
 
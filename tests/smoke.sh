@@ -9,6 +9,7 @@
 #
 # Usage:
 #   ./tests/smoke.sh
+#   SKIP_UNIT_TESTS=1 ./tests/smoke.sh   # skip the Zig unit tests (caller runs them itself)
 #
 # Exit 0 on pass, 1 on fail.
 
@@ -45,12 +46,16 @@ echo "$STATUS" | grep -q "Model:"    || fail "Status output missing Model field"
 pass "Status OK"
 
 # 3. Zig unit tests
-info "Running zig unit tests..."
 cd "$REPO"
-if zig build test 2>&1 | grep -q "error:"; then
-    fail "Zig unit tests failed"
+if [ "${SKIP_UNIT_TESTS:-0}" = "1" ]; then
+    info "Skipping zig unit tests (SKIP_UNIT_TESTS=1)"
+else
+    info "Running zig unit tests..."
+    if zig build test 2>&1 | grep -q "error:"; then
+        fail "Zig unit tests failed"
+    fi
+    pass "Zig unit tests passed"
 fi
-pass "Zig unit tests passed"
 
 # 4. Ollama reachable
 info "Checking Ollama..."